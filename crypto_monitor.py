@@ -1,21 +1,147 @@
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
+import math
 import os
-from datetime import datetime
+import sys
+from collections import Counter, deque
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        """Compact JSON encoding as bytes, matching orjson.dumps"""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _sell_signal(ticker, old_price, new_price, change, volatility, timestamp):
+    """Drop signal"""
+    return {
+        'type': 'SELL_SIGNAL',
+        'coin': ticker,
+        'reason': f"Price dropped {change:.2f}%",
+        'old_price': old_price,
+        'new_price': new_price,
+        'change': change,
+        'volatility': volatility,
+        'timestamp': timestamp,
+        'strength': 'STRONG' if change <= -10 else 'MODERATE'
+    }
+
+
+def _buy_signal(ticker, old_price, new_price, change, volatility, timestamp):
+    """Surge signal"""
+    return {
+        'type': 'BUY_SIGNAL',
+        'coin': ticker,
+        'reason': f"Price surged {change:.2f}%",
+        'old_price': old_price,
+        'new_price': new_price,
+        'change': change,
+        'volatility': volatility,
+        'timestamp': timestamp,
+        'strength': 'STRONG' if change >= 20 else 'MODERATE'
+    }
+
+
+def _volatility_alert(ticker, old_price, new_price, change, volatility, timestamp):
+    """High volatility signal"""
+    return {
+        'type': 'VOLATILITY_ALERT',
+        'coin': ticker,
+        'reason': f"High volatility detected: {volatility:.2f}%",
+        'old_price': old_price,
+        'new_price': new_price,
+        'change': change,
+        'volatility': volatility,
+        'timestamp': timestamp,
+        'strength': 'WARNING'
+    }
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mean_std(prices):
+        """Single-pass mean and population std of a float64 array (Welford)"""
+        mean = 0.0
+        m2 = 0.0
+        for i in range(prices.size):
+            delta = prices[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (prices[i] - mean)
+        return mean, math.sqrt(m2 / prices.size)
+    
+    @njit(cache=True, fastmath=True)
+    def _batch_std(prices, counts):
+        """Per-row mean and population std over the first counts[i] slots"""
+        means = np.zeros(prices.shape[0])
+        stds = np.zeros(prices.shape[0])
+        for row in range(prices.shape[0]):
+            if counts[row] > 0:
+                means[row], stds[row] = _mean_std(prices[row, :counts[row]])
+        return means, stds
+else:
+    # Without numba, use the sum / sum-of-squares form so NumPy never
+    # materializes a deviations array: E[X^2] - E[X]^2, clamped at zero.
+    def _mean_std(prices):
+        """Mean and population std of a float64 array (sum / sum of squares)"""
+        mean = prices.sum() / prices.size
+        return mean, math.sqrt(max(prices.dot(prices) / prices.size - mean * mean, 0.0))
+    
+    def _batch_std(prices, counts):
+        """Per-row mean and population std over the first counts[i] slots"""
+        # Slots past counts[i] are never written and stay zero, so whole-row
+        # sums only see the filled part
+        n = np.maximum(counts, 1)
+        means = prices.sum(axis=1) / n
+        variances = np.einsum('ij,ij->i', prices, prices) / n - means * means
+        return means, np.sqrt(np.maximum(variances, 0.0))
+
 class CryptoTradingAgent:
     """Autonomous cryptocurrency monitoring and trading signal agent"""
     
     def __init__(self, config_file='agent_config.json'):
         self.api_url = "https://api.coingecko.com/api/v3/simple/price"
         self.state_file = 'agent_state.json'
+        self.history_file = 'price_history.npz'
         self.config_file = config_file
+        self._start_mono = time.monotonic()
+        
+        # Reuse one keep-alive connection across polls
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.headers['User-Agent'] = 'crypto-agent/1.0'
         
         # Load configuration
         self.config = self.load_config()
         
+        # The coin set is fixed for the run, so build the query once
+        self._price_params = {
+            'ids': ','.join(self.config['coins'].keys()),
+            'vs_currencies': 'usd'
+        }
+        self._ticker_map = tuple(self.config['coins'].items())
+        
         # Load persistent state
         self.state = self.load_state()
         
@@ -23,12 +149,50 @@ class CryptoTradingAgent:
         if not self.state:
             self.state = {
                 'previous_prices': {},
-                'price_history': {},
-                'signals_generated': [],
                 'last_check': None,
                 'total_alerts': 0,
                 'agent_start_time': datetime.now().isoformat()
             }
+        
+        # Price history as parallel 2-D arrays with one ring buffer row per
+        # ticker: float64 prices and int64 epoch seconds. They are persisted
+        # separately from the JSON state, in history_file.
+        self._tickers = tuple(self.config['coins'].values())
+        self._rows = {ticker: row for row, ticker in enumerate(self._tickers)}
+        shape = (len(self._tickers), self.config['max_history_length'])
+        self._prices = np.zeros(shape, dtype=np.float64)
+        self._timestamps = np.zeros(shape, dtype=np.int64)
+        self._heads = np.zeros(len(self._tickers), dtype=np.intp)
+        self._counts = np.zeros(len(self._tickers), dtype=np.intp)
+        legacy_history = self.state.pop('price_history', None)
+        if legacy_history is not None:
+            # State files from before the split kept history in the JSON
+            for ticker, history in legacy_history.items():
+                if ticker in self._rows:
+                    self._load_history(ticker, history)
+            # Write the npz now, before a later JSON save drops the legacy copy
+            self._save_history()
+        else:
+            self.load_price_history()
+        
+        # Recent signals are capped; per-type totals cover the whole run
+        signals = self.state.pop('signals_generated', [])
+        self._signal_counts = Counter(
+            self.state.pop('signal_counts', None) or (signal['type'] for signal in signals)
+        )
+        self._signals = deque(signals, maxlen=self.config['max_signal_history'])
+        
+        self._signal_rules = self._build_signal_rules()
+    
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def load_config(self) -> dict:
         """Load agent configuration from file or use defaults"""
@@ -48,51 +212,99 @@ class CryptoTradingAgent:
             'check_interval': 300,  # 5 minutes
             'enable_surge_alerts': True,
             'enable_volatility_tracking': True,
-            'max_history_length': 288  # 24 hours of 5-min intervals
+            'max_history_length': 288,  # 24 hours of 5-min intervals
+            'state_save_interval': 12,  # checks between saves (1 hour)
+            'max_signal_history': 1000
         }
         
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults
-                    default_config.update(loaded_config)
-            except Exception as e:
-                print(f"Error loading config: {e}, using defaults")
+        try:
+            with open(self.config_file, 'rb') as f:
+                loaded_config = _json_loads(f.read())
+                # Merge with defaults
+                default_config.update(loaded_config)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading config: {e}, using defaults")
         
         return default_config
     
     def load_state(self) -> Optional[dict]:
         """Load persistent state from file"""
-        if os.path.exists(self.state_file):
-            try:
-                with open(self.state_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading state: {e}")
-        return None
+        try:
+            with open(self.state_file, 'rb', buffering=65536) as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error loading state: {e}")
+            return None
+    
+    def load_price_history(self):
+        """Load the price history ring buffers from file"""
+        try:
+            with np.load(self.history_file) as data:
+                saved = zip(
+                    data['tickers'].tolist(), data['prices'], data['timestamps'],
+                    data['heads'], data['counts']
+                )
+                for ticker, prices, timestamps, head, count in saved:
+                    if ticker in self._rows:
+                        order = np.roll(np.arange(count), -head % max(count, 1))
+                        self._fill_history(ticker, prices[order], timestamps[order])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading price history: {e}")
     
     def save_state(self):
-        """Save current state to file"""
+        """Save current state and price history to file"""
+        self._save_hot()
+        self._save_history()
+    
+    def _save_hot(self):
+        """Save everything except price history to the JSON state file"""
+        state = dict(
+            self.state,
+            signals_generated=list(self._signals),
+            signal_counts=dict(self._signal_counts)
+        )
+        
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            # Compact JSON through a 64 KB buffer, swapped in atomically
+            tmp_file = self.state_file + '.tmp'
+            with open(tmp_file, 'wb', buffering=65536) as f:
+                f.write(_json_dumps(state))
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             print(f"Error saving state: {e}")
     
+    def _save_history(self):
+        """Save the raw price history ring buffers as .npz"""
+        try:
+            tmp_file = self.history_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                np.savez(
+                    f,
+                    tickers=np.array(self._tickers),
+                    prices=self._prices,
+                    timestamps=self._timestamps,
+                    heads=self._heads,
+                    counts=self._counts
+                )
+            os.replace(tmp_file, self.history_file)
+        except Exception as e:
+            print(f"Error saving price history: {e}")
+    
     def get_current_prices(self) -> Optional[Dict[str, float]]:
         """Fetch current cryptocurrency prices"""
         try:
-            params = {
-                'ids': ','.join(self.config['coins'].keys()),
-                'vs_currencies': 'usd'
-            }
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = self._session.get(self.api_url, params=self._price_params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             current_prices = {}
-            for coin_id, ticker in self.config['coins'].items():
+            for coin_id, ticker in self._ticker_map:
                 if coin_id in data:
                     current_prices[ticker] = data[coin_id]['usd']
             
@@ -108,121 +320,157 @@ class CryptoTradingAgent:
             return 0
         return ((new_price - old_price) / old_price) * 100
     
-    def update_price_history(self, current_prices: Dict[str, float]):
+    def update_price_history(self, current_prices: Dict[str, float], now: datetime):
         """Update price history for volatility tracking"""
-        timestamp = datetime.now().isoformat()
+        timestamp = int(now.timestamp())
+        append_price = self._append_price
         
         for ticker, price in current_prices.items():
-            if ticker not in self.state['price_history']:
-                self.state['price_history'][ticker] = []
-            
-            self.state['price_history'][ticker].append({
-                'price': price,
-                'timestamp': timestamp
-            })
-            
-            # Trim history to max length
-            max_len = self.config['max_history_length']
-            if len(self.state['price_history'][ticker]) > max_len:
-                self.state['price_history'][ticker] = self.state['price_history'][ticker][-max_len:]
+            append_price(ticker, price, timestamp)
+    
+    def _load_history(self, ticker: str, history):
+        """Migrate a ticker's list of {'price', 'timestamp'} dicts from a baseline state file"""
+        prices = [entry['price'] for entry in history]
+        timestamps = [
+            int(datetime.fromisoformat(entry['timestamp']).timestamp())
+            for entry in history
+        ]
+        
+        self._fill_history(
+            ticker, np.asarray(prices, dtype=np.float64), np.asarray(timestamps, dtype=np.int64)
+        )
+    
+    def _fill_history(self, ticker: str, prices: np.ndarray, timestamps: np.ndarray):
+        """Copy oldest-first samples into an empty ring buffer, keeping the newest"""
+        row = self._rows[ticker]
+        size = self._prices.shape[1]
+        count = min(len(prices), size)
+        self._prices[row, :count] = prices[len(prices) - count:]
+        self._timestamps[row, :count] = timestamps[len(timestamps) - count:]
+        self._heads[row] = count % size
+        self._counts[row] = count
+    
+    def _append_price(self, ticker: str, price: float, timestamp: int):
+        """Write a sample into the ticker's ring buffer, overwriting the oldest when full"""
+        row = self._rows[ticker]
+        head = self._heads[row]
+        self._prices[row, head] = price
+        self._timestamps[row, head] = timestamp
+        self._heads[row] = (head + 1) % self._prices.shape[1]
+        self._counts[row] = min(self._counts[row] + 1, self._prices.shape[1])
+    
+    def _prices_view(self, ticker: str) -> np.ndarray:
+        """Filled part of the ticker's ring buffer, in storage order"""
+        if ticker not in self._rows:
+            return np.empty(0, dtype=np.float64)
+        row = self._rows[ticker]
+        return self._prices[row, :self._counts[row]]
     
     def calculate_volatility(self, ticker: str) -> float:
         """Calculate price volatility over the configured window"""
-        if ticker not in self.state['price_history'] or len(self.state['price_history'][ticker]) < 2:
+        prices = self._prices_view(ticker)
+        if prices.size < 2:
             return 0
         
-        prices = [entry['price'] for entry in self.state['price_history'][ticker]]
-        avg_price = sum(prices) / len(prices)
+        avg_price, std_dev = _mean_std(prices)
         
         if avg_price == 0:
             return 0
         
-        variance = sum((p - avg_price) ** 2 for p in prices) / len(prices)
-        std_dev = variance ** 0.5
         volatility = (std_dev / avg_price) * 100
         
-        return volatility
+        return float(volatility)
+    
+    def _batch_volatility(self) -> np.ndarray:
+        """Volatility of every tracked ticker, indexed by row"""
+        means, stds = _batch_std(self._prices, self._counts)
+        usable = (self._counts >= 2) & (means != 0)
+        return np.where(usable, stds / np.where(usable, means, 1.0) * 100, 0.0)
+    
+    def _build_signal_rules(self) -> tuple:
+        """Signal rules specialized to the loaded config, in priority order
+        
+        Each rule is a (triggered, make_signal) pair: triggered maps the
+        change and volatility arrays to a hit mask with its threshold bound
+        in, and disabled alert types are left out entirely.
+        """
+        drop_alert = self.config['thresholds']['drop_alert']
+        surge_alert = self.config['thresholds']['surge_alert']
+        
+        rules = [(lambda changes, volatilities: changes <= drop_alert, _sell_signal)]
+        if self.config['enable_surge_alerts']:
+            rules.append((lambda changes, volatilities: changes >= surge_alert, _buy_signal))
+        if self.config['enable_volatility_tracking']:
+            rules.append((lambda changes, volatilities: volatilities > 15, _volatility_alert))
+        return tuple(rules)
     
-    def generate_trading_signals(self, current_prices: Dict[str, float]) -> List[dict]:
+    def generate_trading_signals(self, current_prices: Dict[str, float], now_iso: str) -> List[dict]:
         """Generate trading signals based on multiple factors"""
         signals = []
+        prev = self.state['previous_prices']
         
-        if not self.state['previous_prices']:
+        if not prev:
             return signals
         
-        for ticker in current_prices:
-            if ticker in self.state['previous_prices']:
-                old_price = self.state['previous_prices'][ticker]
-                new_price = current_prices[ticker]
-                change = self.calculate_percentage_change(old_price, new_price)
-                volatility = self.calculate_volatility(ticker)
-                
-                signal = None
-                
-                # Drop signal
-                if change <= self.config['thresholds']['drop_alert']:
-                    signal = {
-                        'type': 'SELL_SIGNAL',
-                        'coin': ticker,
-                        'reason': f"Price dropped {change:.2f}%",
-                        'old_price': old_price,
-                        'new_price': new_price,
-                        'change': change,
-                        'volatility': volatility,
-                        'timestamp': datetime.now().isoformat(),
-                        'strength': 'STRONG' if change <= -10 else 'MODERATE'
-                    }
-                
-                # Surge signal
-                elif self.config['enable_surge_alerts'] and change >= self.config['thresholds']['surge_alert']:
-                    signal = {
-                        'type': 'BUY_SIGNAL',
-                        'coin': ticker,
-                        'reason': f"Price surged {change:.2f}%",
-                        'old_price': old_price,
-                        'new_price': new_price,
-                        'change': change,
-                        'volatility': volatility,
-                        'timestamp': datetime.now().isoformat(),
-                        'strength': 'STRONG' if change >= 20 else 'MODERATE'
-                    }
-                
-                # High volatility signal
-                elif self.config['enable_volatility_tracking'] and volatility > 15:
-                    signal = {
-                        'type': 'VOLATILITY_ALERT',
-                        'coin': ticker,
-                        'reason': f"High volatility detected: {volatility:.2f}%",
-                        'old_price': old_price,
-                        'new_price': new_price,
-                        'change': change,
-                        'volatility': volatility,
-                        'timestamp': datetime.now().isoformat(),
-                        'strength': 'WARNING'
-                    }
-                
-                if signal:
-                    signals.append(signal)
-                    self.state['signals_generated'].append(signal)
-                    self.state['total_alerts'] += 1
+        tickers = [ticker for ticker in current_prices if ticker in prev]
+        if not tickers:
+            return signals
+        
+        rows = self._rows
+        rules = self._signal_rules
+        
+        # Evaluate every ticker at once and only build dicts for the hits
+        old = np.fromiter((prev[t] for t in tickers), np.float64, len(tickers))
+        new = np.fromiter((current_prices[t] for t in tickers), np.float64, len(tickers))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = np.where(old != 0, (new - old) / old * 100, 0.0)
+        volatilities = self._batch_volatility()[[rows[t] for t in tickers]]
+        
+        # First matching rule wins for each ticker
+        kinds = np.full(len(tickers), -1)
+        for kind, (triggered, _) in enumerate(rules):
+            kinds[(kinds < 0) & triggered(changes, volatilities)] = kind
+        
+        append_signal = signals.append
+        record_signal = self._signals.append
+        signal_counts = self._signal_counts
+        
+        for i in np.nonzero(kinds >= 0)[0]:
+            ticker = tickers[i]
+            make_signal = rules[kinds[i]][1]
+            signal = make_signal(
+                ticker, prev[ticker], current_prices[ticker],
+                float(changes[i]), float(volatilities[i]), now_iso
+            )
+            append_signal(signal)
+            record_signal(signal)
+            signal_counts[signal['type']] += 1
+        
+        self.state['total_alerts'] += len(signals)
         
         return signals
     
-    def display_status(self, current_prices: Dict[str, float]):
+    def display_status(self, current_prices: Dict[str, float], now: datetime, price_strs: Dict[str, str]):
         """Display current market status"""
-        print(f"\n{'='*60}")
-        print(f"Agent Status: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Running since: {self.state['agent_start_time']}")
-        print(f"Total signals generated: {self.state['total_alerts']}")
-        print(f"{'='*60}")
+        lines = [
+            f"\n{'='*60}",
+            f"Agent Status: {now.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Running since: {self.state['agent_start_time']}",
+            f"Total signals generated: {self.state['total_alerts']}",
+            f"{'='*60}"
+        ]
+        
+        prev = self.state['previous_prices']
+        percentage_change = self.calculate_percentage_change
+        calculate_volatility = self.calculate_volatility
         
         for ticker, price in current_prices.items():
-            price_str = f"${price:,.2f}"
+            price_str = price_strs[ticker]
             
-            if ticker in self.state['previous_prices']:
-                old_price = self.state['previous_prices'][ticker]
-                change = self.calculate_percentage_change(old_price, price)
-                volatility = self.calculate_volatility(ticker)
+            if ticker in prev:
+                old_price = prev[ticker]
+                change = percentage_change(old_price, price)
+                volatility = calculate_volatility(ticker)
                 
                 if change > 0:
                     change_str = f"UP +{change:.2f}%"
@@ -231,46 +479,48 @@ class CryptoTradingAgent:
                 else:
                     change_str = "FLAT 0.00%"
                 
-                print(f"{ticker}: {price_str} {change_str} | Volatility: {volatility:.2f}%")
+                lines.append(f"{ticker}: {price_str} {change_str} | Volatility: {volatility:.2f}%")
             else:
-                print(f"{ticker}: {price_str} | Initializing...")
+                lines.append(f"{ticker}: {price_str} | Initializing...")
+        
+        # One write per block instead of a write per line
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def display_signals(self, signals: List[dict]):
+    def display_signals(self, signals: List[dict], price_strs: Dict[str, str]):
         """Display generated trading signals"""
         if not signals:
             return
         
-        print(f"\n{'!'*60}")
-        print("TRADING SIGNALS GENERATED")
-        print(f"{'!'*60}")
+        lines = [
+            f"\n{'!'*60}",
+            "TRADING SIGNALS GENERATED",
+            f"{'!'*60}"
+        ]
         
         for signal in signals:
-            print(f"\n{signal['type']} - {signal['coin']}")
-            print(f"Reason: {signal['reason']}")
-            print(f"Price: ${signal['old_price']:,.2f} -> ${signal['new_price']:,.2f}")
-            print(f"Volatility: {signal['volatility']:.2f}%")
-            print(f"Signal Strength: {signal['strength']}")
-            print(f"Time: {signal['timestamp']}")
-        
-        print(f"\n{'!'*60}")
+            lines.extend((
+                f"\n{signal['type']} - {signal['coin']}",
+                f"Reason: {signal['reason']}",
+                f"Price: ${signal['old_price']:,.2f} -> {price_strs[signal['coin']]}",
+                f"Volatility: {signal['volatility']:.2f}%",
+                f"Signal Strength: {signal['strength']}",
+                f"Time: {signal['timestamp']}"
+            ))
+        
+        lines.append(f"\n{'!'*60}")
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def get_agent_summary(self) -> dict:
         """Get summary of agent performance"""
         summary = {
-            'uptime': str(datetime.now() - datetime.fromisoformat(self.state['agent_start_time'])),
+            'uptime': str(timedelta(seconds=time.monotonic() - self._start_mono)),
             'total_signals': self.state['total_alerts'],
             'monitored_coins': len(self.config['coins']),
             'check_interval': f"{self.config['check_interval']} seconds",
             'last_check': self.state['last_check']
         }
         
-        # Count signal types
-        signal_types = {}
-        for signal in self.state['signals_generated']:
-            signal_type = signal['type']
-            signal_types[signal_type] = signal_types.get(signal_type, 0) + 1
-        
-        summary['signal_breakdown'] = signal_types
+        summary['signal_breakdown'] = dict(self._signal_counts)
         return summary
     
     def run_agent(self):
@@ -282,31 +532,48 @@ class CryptoTradingAgent:
         print(f"Surge threshold: {self.config['thresholds']['surge_alert']}%")
         print("Press Ctrl+C to stop\n")
         
+        checks = 0
+        interval = self.config['check_interval']
+        next_tick = time.monotonic()
+        
         try:
             while True:
                 # Fetch current prices
                 current_prices = self.get_current_prices()
                 
                 if current_prices:
+                    checks += 1
+                    
+                    # One clock read per cycle, shared by every ticker
+                    now = datetime.now()
+                    now_iso = now.isoformat()
+                    
+                    # Format each price once for both status and signal output
+                    price_strs = {ticker: f"${price:,.2f}" for ticker, price in current_prices.items()}
+                    
                     # Update price history
-                    self.update_price_history(current_prices)
+                    self.update_price_history(current_prices, now)
                     
                     # Generate trading signals
-                    signals = self.generate_trading_signals(current_prices)
+                    signals = self.generate_trading_signals(current_prices, now_iso)
                     
                     # Display status
-                    self.display_status(current_prices)
+                    self.display_status(current_prices, now, price_strs)
                     
                     # Display any new signals
                     if signals:
-                        self.display_signals(signals)
+                        self.display_signals(signals, price_strs)
                     
                     # Update state
-                    self.state['previous_prices'] = current_prices.copy()
-                    self.state['last_check'] = datetime.now().isoformat()
+                    self.state['previous_prices'] = current_prices
+                    self.state['last_check'] = now_iso
                     
-                    # Save state to disk
-                    self.save_state()
+                    # Save state to disk when a signal fired, otherwise periodically;
+                    # the larger price history is only written on the periodic save
+                    if checks % self.config['state_save_interval'] == 0:
+                        self.save_state()
+                    elif signals:
+                        self._save_hot()
                     
                     # Show summary every 10 checks
                     if self.state['total_alerts'] % 10 == 0 and self.state['total_alerts'] > 0:
@@ -317,9 +584,15 @@ class CryptoTradingAgent:
                 else:
                     print("WARNING: Failed to fetch prices, retrying...")
                 
-                # Wait for next check
-                print(f"\nSleeping for {self.config['check_interval']} seconds...")
-                time.sleep(self.config['check_interval'])
+                # Wait for the next check on a fixed cadence so fetch and save
+                # time don't accumulate as drift; resync if we fell far behind
+                next_tick += interval
+                if time.monotonic() > next_tick + interval:
+                    next_tick = time.monotonic()
+                delay = max(0.0, next_tick - time.monotonic())
+                print(f"\nSleeping for {delay:.0f} seconds...")
+                sys.stdout.flush()
+                time.sleep(delay)
                 
         except KeyboardInterrupt:
             print("\n\n>>> Agent stopped by user")
@@ -331,6 +604,7 @@ class CryptoTradingAgent:
             
             # Save final state
             self.save_state()
+            self.close()
             print("\n>>> State saved successfully")
             
         except Exception as e: